@@ -8,7 +8,7 @@ from pydantic import BaseModel, ConfigDict, Field
 from mmio.application.cli.commands.mmio_select import SelectMMIOFileInputCLI
 from mmio.config.mmio_settings import MMIOSettings
 from mmio.core.logger import LoggerManager
-from mmio.infrastructure.file_handling.mmio_filemanager import MMIOFileManager
+from mmio.infrastructure.file_handling.mmio_filemanager import MMIOFileManager, mmio_filemanager
 
 logger = LoggerManager.get_logger(__name__)
 
@@ -32,7 +32,7 @@ class MMIOCLIManager(BaseModel):
 
     mmio_select: SelectMMIOFileInputCLI = Field(default_factory=SelectMMIOFileInputCLI)
     settings: MMIOSettings = Field(default_factory=MMIOSettings.get_instance)
-    file_manager: MMIOFileManager = Field(default_factory=MMIOFileManager.get_instance)
+    file_manager: MMIOFileManager = Field(default_factory=lambda: mmio_filemanager)
     selected_file: Path | None = None
 
     def setup_cli(self) -> None:
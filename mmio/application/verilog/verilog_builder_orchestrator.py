@@ -1,8 +1,9 @@
+import sys
 from enum import Enum
 from io import StringIO
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from mmio.application.verilog.generators.address_check import AddressCheckGenerator
 from mmio.application.verilog.generators.counter_generator import CounterGenerator
@@ -11,6 +12,7 @@ from mmio.application.verilog.generators.rom import ROMGenerator
 from mmio.application.verilog.generators.static_generator import StaticCodeGenerator
 from mmio.application.verilog.verilog_models import (
     AddressCheckEntry,
+    BarBundle,
     CounterEntry,
     LogicEntries,
     ROMEntry,
@@ -48,6 +50,8 @@ class VerilogBuilderOrchestrator(BaseModel):
 
     bar_number: int = Field(default=0)
 
+    _bar_index: dict[int, BarBundle] = PrivateAttr(default_factory=dict)
+
     verilog_header: VerilogStatic = Field(
         default_factory=lambda: VerilogStatic(
             bar_number=0,
@@ -118,21 +122,38 @@ class VerilogBuilderOrchestrator(BaseModel):
         # Set the current VerilogData instance
         self.verilog_data = mmio_data
 
+        # Data may have changed, rebuild the per-BAR index on demand
+        self._bar_index.clear()
+
         # Update all generator instances with the data
         for generator in self.generator_instances.values():
-            addresses = VerilogData.addresses(bar=generator.bar_number)
-            bit_widths = VerilogData.get_bar_address_bit_widths(generator.bar_number)
-            read_values = VerilogData.read_values(bar=generator.bar_number)
-            write_values = VerilogData.write_values(bar=generator.bar_number)
-            defaults = VerilogData.get_default_values(generator.bar_number)
-
-            generator.set_bar_data(
-                addresses=addresses,
-                bit_widths=bit_widths,
-                read_values=read_values,
-                write_values=write_values,
-                defaults=defaults,
-            )
+            generator.set_bar_bundle(self._get_bar_bundle(generator.bar_number))
+
+    def _get_bar_bundle(self, bar_number: int) -> BarBundle:
+        """Get the indexed data for a BAR, collecting it from VerilogData on first use."""
+        bundle = self._bar_index.get(bar_number)
+        if bundle is None:
+            bundle = self._fetch_bar_data(bar_number)
+            self._bar_index[bar_number] = bundle
+        return bundle
+
+    def _fetch_bar_data(self, bar_number: int) -> BarBundle:
+        """Collect all data for a BAR from VerilogData in a single bundle.
+
+        Addresses and values repeat heavily, so they are interned to share one
+        string object per distinct value across BARs and generators.
+        """
+        intern = sys.intern
+        return BarBundle(
+            addresses=[intern(address) for address in VerilogData.addresses(bar=bar_number)],
+            bit_widths={
+                intern(address): width
+                for address, width in VerilogData.get_bar_address_bit_widths(bar_number).items()
+            },
+            read_values=[intern(value) for value in VerilogData.read_values(bar=bar_number)],
+            write_values=[intern(value) for value in VerilogData.write_values(bar=bar_number)],
+            defaults=VerilogData.get_default_values(bar_number),
+        )
 
     @property
     def available_bars(self) -> list[int]:
@@ -156,8 +177,9 @@ class VerilogBuilderOrchestrator(BaseModel):
             logger.warning("No VerilogData set, cannot generate code")
             return False
 
-        bar_addresses = self.verilog_data.addresses(bar=bar_number)
-        address_bit_widths = self.verilog_data.get_bar_address_bit_widths(bar_number)
+        bundle = self._get_bar_bundle(bar_number)
+        bar_addresses = bundle.addresses
+        address_bit_widths = bundle.bit_widths
 
         logger.info(f"Found addresses for BAR: {bar_number}: {bar_addresses}")
         logger.info(f"Address bit widths: {address_bit_widths}")
@@ -180,14 +202,8 @@ class VerilogBuilderOrchestrator(BaseModel):
         generator = self.generator_classes[field_type](bar_number=bar_number)
         self.generator_instances[field_type] = generator
 
-        if hasattr(generator, "set_bar_data"):
-            generator.set_bar_data(
-                addresses=self.verilog_data.addresses(bar=bar_number),
-                bit_widths=self.verilog_data.get_bar_address_bit_widths(bar_number),
-                read_values=self.verilog_data.read_values(bar=bar_number),
-                write_values=self.verilog_data.write_values(bar=bar_number),
-                defaults=self.verilog_data.get_default_values(bar_number),
-            )
+        if hasattr(generator, "set_bar_bundle"):
+            generator.set_bar_bundle(self._get_bar_bundle(bar_number))
 
         return generator
 
@@ -213,25 +229,25 @@ class VerilogBuilderOrchestrator(BaseModel):
 
     def _get_operation_value(self, operation: str | None, read_value: StringIO, write_value: StringIO) -> str:
         """Get the appropriate value based on the operation."""
-        return str(read_value.getvalue() if operation == "read" else write_value.getvalue())
+        return (read_value if operation == "read" else write_value).getvalue()
 
     def _handle_header(self, generator: StaticCodeGenerator) -> str:
         """Handle header field type generation."""
         header = generator.generate_module_header()
         self.verilog_header = header
-        return str(self.verilog_header.verilog_header.getvalue())
+        return self.verilog_header.verilog_header.getvalue()
 
     def _handle_state_machine_start(self, generator: StaticCodeGenerator) -> str:
         """Handle state machine start field type generation."""
         start = generator.generate_state_machine_start()
         self.verilog_header = start
-        return str(self.verilog_header.verilog_state_machine_start.getvalue())
+        return self.verilog_header.verilog_state_machine_start.getvalue()
 
     def _handle_state_machine_end(self, generator: StaticCodeGenerator) -> str:
         """Handle state machine end field type generation."""
         end = generator.generate_state_machine_end()
         self.verilog_header = end
-        return str(self.verilog_header.verilog_state_machine_end.getvalue())
+        return self.verilog_header.verilog_state_machine_end.getvalue()
 
     def _handle_rom(self, generator: ROMGenerator, operation: str | None) -> str:
         """Handle ROM field type generation."""
@@ -245,22 +261,18 @@ class VerilogBuilderOrchestrator(BaseModel):
         """Handle ROM init field type generation."""
         generator.generate_rom_init(self.bar_number)
         self.verilog_rom = generator.verilog_rom
-
-        return str(
-            self.verilog_rom.verilog_read_rom_init.getvalue()
-            if operation == "read"
-            else self.verilog_rom.verilog_write_rom_init.getvalue()
+        return self._get_operation_value(
+            operation, self.verilog_rom.verilog_read_rom_init, self.verilog_rom.verilog_write_rom_init
         )
 
     def _handle_reset_counter(self, generator: CounterGenerator, operation: str | None) -> str:
         """Handle reset counter field type generation."""
         generator.generate_reset_counter(self.bar_number)
         self.verilog_counter = generator.verilog_counter
-
-        return str(
-            self.verilog_counter.verilog_reset_read_counter.getvalue()
-            if operation == "read"
-            else self.verilog_counter.verilog_reset_write_counter.getvalue()
+        return self._get_operation_value(
+            operation,
+            self.verilog_counter.verilog_reset_read_counter,
+            self.verilog_counter.verilog_reset_write_counter,
         )
 
     def _handle_counter(self, generator: CounterGenerator, operation: str | None) -> str:
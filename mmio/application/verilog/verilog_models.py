@@ -1,13 +1,27 @@
 """Verilog models for pre-generated Verilog code."""
 
+from functools import cache
 from io import StringIO
+from typing import NamedTuple
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from mmio.core.logger import LoggerManager
 
 logger = LoggerManager.get_logger(__name__)
 
+_DEFAULT_FIELD_KEYS: tuple[str, ...] = ("header", "rom_init", "state_machine", "reset_counter")
+
+
+class BarBundle(NamedTuple):
+    """Per-BAR data shared by all generators working on that BAR."""
+
+    addresses: list[str]
+    bit_widths: dict[str, int]
+    read_values: list[str]
+    write_values: list[str]
+    defaults: tuple[str, str]
+
 
 class VerilogModelBase(BaseModel):
     """Base class for all Verilog models with bar number."""
@@ -20,6 +34,16 @@ class VerilogGenerator(VerilogModelBase):
 
     bar_number: int
 
+    _bar_data: BarBundle = PrivateAttr(
+        default_factory=lambda: BarBundle(
+            addresses=[],
+            bit_widths={},
+            read_values=[],
+            write_values=[],
+            defaults=("00000000", "00000000"),
+        )
+    )
+
     @classmethod
     def get_available_bars(cls) -> list[int]:
         """Get list of BARs available for this generator.
@@ -30,6 +54,19 @@ class VerilogGenerator(VerilogModelBase):
         """
         return []
 
+    @classmethod
+    @cache
+    def _resolve_field_name(cls, operation: str | None, field_type: str | None) -> str:
+        """Resolve the StringIO field name for an operation/field type pair, cached per class."""
+        if operation and field_type:
+            return f"verilog_{operation.lower()}_{field_type}"
+        if not operation and not field_type:
+            return next(
+                (name for name in cls.model_fields if any(key in name.lower() for key in _DEFAULT_FIELD_KEYS)),
+                "verilog",
+            )
+        return f"verilog_{field_type}"
+
     def get_verilog_content(self, operation: str | None = None, field_type: str | None = None) -> StringIO:
         """Get Verilog content from a StringIO field.
 
@@ -51,25 +88,7 @@ class VerilogGenerator(VerilogModelBase):
         if operation and operation.lower() not in ["read", "write"]:
             raise ValueError("Operation must be 'read' or 'write' if provided")
 
-        field_name = "verilog"
-        if operation and field_type:
-            field_name += f"_{operation.lower()}_{field_type}"
-        elif not operation and not field_type:
-            for name in self.model_fields:
-                if "header" in name.lower():
-                    field_name = name
-                    break
-                if "rom_init" in name.lower():
-                    field_name = name
-                    break
-                if "state_machine" in name.lower():
-                    field_name = name
-                    break
-                if "reset_counter" in name.lower():
-                    field_name = name
-                    break
-        else:
-            field_name += f"_{field_type}"
+        field_name = self._resolve_field_name(operation, field_type)
 
         logger.info(f"Looking for field: {field_name}")
 
@@ -77,10 +96,7 @@ class VerilogGenerator(VerilogModelBase):
             value = getattr(self, field_name)
             if isinstance(value, StringIO):
                 logger.info(f"Found StringIO field {field_name} with content: {value.getvalue()}")
-                result = StringIO()
-                result.write(value.getvalue())
-                result.seek(0)
-                return result
+                return value
             else:
                 logger.warning(f"Field {field_name} exists but is not StringIO: {type(value)}")
         except AttributeError:
@@ -106,44 +122,60 @@ class VerilogGenerator(VerilogModelBase):
             write_values: List of write values for this BAR
             defaults: Tuple of (read_default, write_default) values
 
+        """
+        self.set_bar_bundle(
+            BarBundle(
+                addresses=addresses,
+                bit_widths=bit_widths,
+                read_values=read_values,
+                write_values=write_values,
+                defaults=defaults,
+            )
+        )
+
+    def set_bar_bundle(self, bundle: BarBundle) -> None:
+        """Set BAR-specific data for the generator from a shared bundle.
+
+        The bundle is stored by reference, so generators working on the same
+        BAR share one copy of the data.
+
+        Args:
+            bundle: BAR data bundle to use for generation
+
         """
         logger.info(f"Setting BAR {self.bar_number} data:")
-        logger.info(f"Addresses: {addresses}")
-        logger.info(f"Bit widths: {bit_widths}")
-        logger.info(f"Read values: {read_values}")
-        logger.info(f"Write values: {write_values}")
-        logger.info(f"Defaults: {defaults}")
-
-        self._addresses = addresses
-        self._bit_widths = bit_widths
-        self._read_values = read_values
-        self._write_values = write_values
-        self._defaults = defaults
+        logger.info(f"Addresses: {bundle.addresses}")
+        logger.info(f"Bit widths: {bundle.bit_widths}")
+        logger.info(f"Read values: {bundle.read_values}")
+        logger.info(f"Write values: {bundle.write_values}")
+        logger.info(f"Defaults: {bundle.defaults}")
+
+        self._bar_data = bundle
 
     @property
     def addresses(self) -> list[str]:
         """Get addresses for current BAR."""
-        return getattr(self, "_addresses", [])
+        return self._bar_data.addresses
 
     @property
     def bit_widths(self) -> dict[str, int]:
         """Get bit widths for current BAR."""
-        return getattr(self, "_bit_widths", {})
+        return self._bar_data.bit_widths
 
     @property
     def read_values(self) -> list[str]:
         """Get read values for current BAR."""
-        return getattr(self, "_read_values", [])
+        return self._bar_data.read_values
 
     @property
     def write_values(self) -> list[str]:
         """Get write values for current BAR."""
-        return getattr(self, "_write_values", [])
+        return self._bar_data.write_values
 
     @property
     def defaults(self) -> tuple[str, str]:
         """Get default values (read, write) for current BAR."""
-        return getattr(self, "_defaults", ("00000000", "00000000"))
+        return self._bar_data.defaults
 
     def get_unique_sorted_addresses(self, addresses: list[str]) -> list[str]:
         """Helper function to deduplicate and sort addresses."""
@@ -157,12 +189,6 @@ class VerilogStatic(VerilogGenerator):
     verilog_state_machine_start: StringIO = Field(default_factory=StringIO)
     verilog_state_machine_end: StringIO = Field(default_factory=StringIO)
 
-    @field_validator("verilog_header", "verilog_state_machine_start", "verilog_state_machine_end")
-    @classmethod
-    def validate_static(cls, value: StringIO) -> StringIO:
-        """Validate static code format."""
-        return value
-
 
 class ROMEntry(VerilogGenerator):
     """Data class with pre-generated ROM entries for read/write operations."""
@@ -172,13 +198,9 @@ class ROMEntry(VerilogGenerator):
     verilog_read_rom_init: StringIO = Field(default_factory=StringIO)
     verilog_write_rom_init: StringIO = Field(default_factory=StringIO)
 
-    @field_validator("verilog_read_rom", "verilog_write_rom", "verilog_read_rom_init", "verilog_write_rom_init")
-    @classmethod
-    def validate_rom(cls, value: StringIO) -> StringIO:
-        """Validate ROM format."""
-        return value
-
-    def get_rom_name(self, address: str, operation: str) -> str:
+    @staticmethod
+    @cache
+    def get_rom_name(address: str, operation: str) -> str:
         """Get ROM name for a specific address and operation."""
         return f"{operation.upper()}_{address}"
 
@@ -189,12 +211,6 @@ class AddressCheckEntry(VerilogGenerator):
     verilog_read_addr_check: StringIO = Field(default_factory=StringIO)
     verilog_write_addr_check: StringIO = Field(default_factory=StringIO)
 
-    @field_validator("verilog_read_addr_check", "verilog_write_addr_check")
-    @classmethod
-    def validate_address(cls, value: StringIO) -> StringIO:
-        """Validate address format."""
-        return value
-
 
 class CounterEntry(VerilogGenerator):
     """Data class with pre-generated counters for read/write operations."""
@@ -204,18 +220,9 @@ class CounterEntry(VerilogGenerator):
     verilog_reset_read_counter: StringIO = Field(default_factory=StringIO)
     verilog_reset_write_counter: StringIO = Field(default_factory=StringIO)
 
-    @field_validator(
-        "verilog_read_counter",
-        "verilog_write_counter",
-        "verilog_reset_read_counter",
-        "verilog_reset_write_counter",
-    )
-    @classmethod
-    def validate_counter(cls, value: StringIO) -> StringIO:
-        """Validate counter format."""
-        return value
-
-    def get_counter_name(self, address: str, operation: str) -> str:
+    @staticmethod
+    @cache
+    def get_counter_name(address: str, operation: str) -> str:
         """Get counter name for a specific address and operation."""
         return f"{operation.upper()}_C_{address}"
 
@@ -225,9 +232,3 @@ class LogicEntries(VerilogGenerator):
 
     verilog_read_cases: StringIO = Field(default_factory=StringIO)
     verilog_write_cases: StringIO = Field(default_factory=StringIO)
-
-    @field_validator("verilog_read_cases", "verilog_write_cases")
-    @classmethod
-    def validate_cases(cls, value: StringIO) -> StringIO:
-        """Validate cases format."""
-        return value
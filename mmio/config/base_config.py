@@ -1,7 +1,7 @@
 """Base configuration class."""
 
+from functools import cache
 from pathlib import Path
-from typing import ClassVar, Optional
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -10,8 +10,6 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 class BaseConfig(BaseSettings):
     """Base configuration class."""
 
-    _instance: ClassVar[Optional["BaseConfig"]] = None
-
     workdir: Path = Field(default=(Path.cwd()))
     format: str = Field(default="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
     date_format: str = Field(default="%Y-%m-%d %H:%M:%S")
@@ -26,12 +24,10 @@ class BaseConfig(BaseSettings):
     )
 
     @classmethod
+    @cache
     def get_instance(cls) -> "BaseConfig":
-        """Get the singleton instance of BaseConfig."""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        """Get the singleton instance of BaseConfig, built on first use."""
+        return cls()
 
 
-base_config_instance = BaseConfig()
 base_config: BaseConfig = BaseConfig.get_instance()
@@ -19,7 +19,7 @@ class CLIOptions(BaseModel):
 
     """
 
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
 
     bar_selection: list[int] | None = Field(default=None, description="List of BARs to process")
     operation_filter: str = Field(default="B", description="Operation filter (R/W/B)")
@@ -2,13 +2,28 @@
 
 import json
 import logging
+from functools import cache
 from pathlib import Path
-from typing import Any, ClassVar, Optional, Self
+from typing import Any, Self
 
 from pydantic import BaseModel, Field, model_validator
 from pydantic_settings import SettingsConfigDict
 
-from mmio.config.base_config import BaseConfig
+from mmio.config.base_config import BaseConfig, base_config
+
+try:
+    import orjson
+
+    def _dumps(data: dict[str, Any]) -> bytes:
+        """Serialize settings data to indented JSON bytes with orjson."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+
+    def _dumps(data: dict[str, Any]) -> bytes:
+        """Serialize settings data to indented JSON bytes with the standard library."""
+        return json.dumps(data, indent=2).encode()
+
 
 LOG_LEVELS: dict[str, int] = {
     "DEBUG": logging.DEBUG,
@@ -34,18 +49,16 @@ class LogSettings(BaseModel):
 
     """
 
-    _instance: ClassVar[Optional["LogSettings"]] = None
-
     # From BaseConfig
     base_settings: BaseConfig = Field(default_factory=BaseConfig.get_instance)
-    workdir: Path = Field(default_factory=lambda: BaseConfig.get_instance().workdir)
-    format: str = Field(default_factory=lambda: BaseConfig.get_instance().format)
-    date_format: str = Field(default_factory=lambda: BaseConfig.get_instance().date_format)
+    workdir: Path = Field(default=base_config.workdir)
+    format: str = Field(default=base_config.format)
+    date_format: str = Field(default=base_config.date_format)
 
     level: str = Field(default="WARNING")
     file_enabled: bool = Field(default=True)
-    log_file: Path | None = Field(default_factory=lambda: BaseConfig.get_instance().workdir / "mmio.log")
-    settings_file: Path = Field(default_factory=lambda: BaseConfig.get_instance().workdir / "mmio_log_settings.json")
+    log_file: Path | None = Field(default=base_config.workdir / "mmio.log")
+    settings_file: Path = Field(default=base_config.workdir / "mmio_log_settings.json")
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -57,11 +70,10 @@ class LogSettings(BaseModel):
     )
 
     @classmethod
+    @cache
     def get_instance(cls) -> "LogSettings":
-        """Get the singleton instance of LogSettings."""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        """Get the singleton instance of LogSettings, built on first use."""
+        return cls()
 
     @classmethod
     def get_workdir(cls) -> Path:
@@ -89,12 +101,10 @@ class LogSettings(BaseModel):
         """
         save_path: Path = file_path or self.settings_file
 
-        data: dict[str, Any] = self.model_dump()
-        if data.get("log_file"):
-            data["log_file"] = str(data["log_file"])
+        data: dict[str, Any] = self.model_dump(mode="json")
 
         try:
-            save_path.write_text(json.dumps(data, indent=2))
+            save_path.write_bytes(_dumps(data))
         except Exception as e:
             logging.getLogger(__name__).error(f"Failed to save log settings: {e}")
 
@@ -115,10 +125,9 @@ class LogSettings(BaseModel):
             return cls()
 
         try:
-            data: dict[str, Any] = json.loads(load_path.read_text())
-            if data.get("log_file"):
-                data["log_file"] = Path(data["log_file"])
-            return cls(**data)
+            data: dict[str, Any] = json.loads(load_path.read_bytes())
+            data.pop("base_settings", None)
+            return cls.model_validate(data)
         except Exception as e:
             logging.getLogger(__name__).error(f"Failed to load log settings: {e}")
             return cls()
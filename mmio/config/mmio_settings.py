@@ -1,13 +1,13 @@
 """Configuration from .env file and paths."""
 
 import os
+from functools import cache
 from pathlib import Path
-from typing import ClassVar, Optional
 
 from pydantic import Field, ValidationInfo, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from mmio.config.base_config import BaseConfig
+from mmio.config.base_config import BaseConfig, base_config
 from mmio.core.logger import LoggerManager
 
 logger = LoggerManager.get_logger(__name__)
@@ -16,12 +16,10 @@ logger = LoggerManager.get_logger(__name__)
 class MMIOSettings(BaseSettings):
     """Configuration for MMIO log file input handling."""
 
-    _instance: ClassVar[Optional["MMIOSettings"]] = None
-
     # From BaseConfig
     base_settings: BaseConfig = Field(default_factory=BaseConfig.get_instance)
-    workdir: Path = Field(default_factory=lambda: BaseConfig.get_instance().workdir)
-    file_input_path: Path | None = Field(default_factory=lambda: BaseConfig.get_instance().workdir / "input" / "mmio")
+    workdir: Path = Field(default=base_config.workdir)
+    file_input_path: Path | None = Field(default=base_config.workdir / "input" / "mmio")
     file_input_name: str | None = Field(default=None)
 
     model_config = SettingsConfigDict(
@@ -34,34 +32,31 @@ class MMIOSettings(BaseSettings):
     )
 
     @classmethod
+    @cache
     def get_instance(cls) -> "MMIOSettings":
-        """Get the singleton instance of MMIOSettings."""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        """Get the singleton instance of MMIOSettings, built on first use."""
+        return cls()
 
     @field_validator("workdir", mode="before")
     @classmethod
     def ensure_workdir(cls, value: Path | str) -> Path:
-        """Ensure workdir is a Path and exists."""
+        """Ensure workdir is a Path.
+
+        The directory itself is created by the file managers on first use.
+        """
         if not isinstance(value, Path):
             value = Path(str(value))
-        if not value.exists():
-            value.mkdir(parents=True, exist_ok=True)
         return value
 
     @field_validator("file_input_path", mode="after")
     @classmethod
     def resolve_input_path(cls, value: Path, info: ValidationInfo) -> Path:
-        """Resolve the input path relative to workdir if it's not absolute."""
+        """Resolve the input path relative to workdir if it's not absolute, without touching the filesystem."""
         if not value.is_absolute():
             workdir = info.data.get("workdir")
             if workdir is None:
-                workdir = BaseConfig.get_instance().workdir
+                workdir = base_config.workdir
             value = workdir / value
-        if not value.exists():
-            value.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Created input directory: {value}")
         return value
 
     @field_validator("file_input_name", mode="before")
@@ -1,12 +1,13 @@
 """Configuration for Verilog code generation output."""
 
+from functools import cache
 from pathlib import Path
-from typing import Any, ClassVar, Optional
+from typing import Any
 
 from pydantic import Field, ValidationInfo, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from mmio.config.base_config import BaseConfig
+from mmio.config.base_config import BaseConfig, base_config
 from mmio.core.logger import LoggerManager
 
 logger = LoggerManager.get_logger(__name__)
@@ -15,15 +16,11 @@ logger = LoggerManager.get_logger(__name__)
 class VerilogSettings(BaseSettings):
     """Configuration for Verilog code generation output."""
 
-    _instance: ClassVar[Optional["VerilogSettings"]] = None
-
     # From BaseConfig
     base_settings: BaseConfig = Field(default_factory=BaseConfig.get_instance)
 
     module_header: str | None = "cool_bar_controller"
-    file_output_path: Path | None = Field(
-        default_factory=lambda: BaseConfig.get_instance().workdir / "output" / "verilog"
-    )
+    file_output_path: Path | None = Field(default=base_config.workdir / "output" / "verilog")
     file_output_name: str | None = Field(default=None)
 
     model_config = SettingsConfigDict(
@@ -36,22 +33,20 @@ class VerilogSettings(BaseSettings):
     )
 
     @classmethod
+    @cache
     def get_instance(cls) -> "VerilogSettings":
-        """Get the singleton instance of VerilogSettings."""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        """Get the singleton instance of VerilogSettings, built on first use."""
+        return cls()
 
     @field_validator("file_output_path", mode="before")
     @classmethod
     def validate_directory_exists(cls, value: Path | str, info: ValidationInfo) -> Path:
-        """Ensure the Verilog output directory exists if a path is provided."""
+        """Coerce the Verilog output directory to a Path.
+
+        The directory itself is created by the output manager before the first write.
+        """
         if not isinstance(value, Path):
             value = Path(value)
-        if value.exists():
-            return value
-        value.mkdir(parents=True, exist_ok=True)
-        logger.error(f"Verilog output directory did not exist, creating: {value}")
         return value
 
     @field_validator("file_output_name", mode="after")
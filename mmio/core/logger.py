@@ -1,7 +1,10 @@
 """Centralized logging configuration for the MMIO application."""
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 from pydantic import BaseModel, Field
@@ -29,11 +32,16 @@ class LoggerManager:
 
     This class handles the configuration and creation of loggers
     throughout the application, ensuring consistent logging behavior.
+
+    The console handler writes on the calling thread, so log lines stay in order
+    with interactive prompts. File handlers run on a QueueListener thread, so
+    callers never block on file I/O.
     """
 
     _config: LogConfig = LogConfig()
     _initialized: bool = False
-    _loggers: dict[str, logging.Logger] = {}
+    _package_logger: logging.Logger = logging.getLogger(__name__.partition(".")[0])
+    _listener: QueueListener | None = None
 
     @classmethod
     def initialize(
@@ -76,7 +84,7 @@ class LoggerManager:
             try:
                 file_handler = logging.FileHandler(cls._config.file_path)
                 file_handler.setFormatter(formatter)
-                root_logger.addHandler(file_handler)
+                cls._queue_handler(file_handler)
             except Exception as e:
                 cls.get_logger("LoggerManager").error(f"Failed to create file handler: {e}")
                 console_handler.emit(
@@ -93,6 +101,24 @@ class LoggerManager:
 
         cls._initialized = True
 
+    @classmethod
+    def _queue_handler(cls, handler: logging.Handler) -> None:
+        """Run a handler on the queue listener thread, starting the listener on first use.
+
+        Args:
+            handler: The handler to move off the calling thread
+
+        """
+        if cls._listener is not None:
+            cls._listener.handlers = (*cls._listener.handlers, handler)
+            return
+
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        logging.getLogger().addHandler(QueueHandler(log_queue))
+        cls._listener = QueueListener(log_queue, handler, respect_handler_level=True)
+        cls._listener.start()
+        atexit.register(cls._listener.stop)
+
     @classmethod
     def get_logger(cls, name: str) -> logging.Logger:
         """Get a logger with the specified name.
@@ -104,30 +130,27 @@ class LoggerManager:
             A configured logger instance
 
         """
-        if not cls._initialized:
-            cls.initialize()
-
-        if name not in cls._loggers:
-            logger = logging.getLogger(name)
-            cls._loggers[name] = logger
-
-        return cls._loggers[name]
+        return logging.getLogger(sys.intern(name))
 
     @classmethod
     def set_level(cls, level: int) -> None:
-        """Set the logging level for all loggers.
+        """Set the logging level for all application loggers.
+
+        Module loggers inherit the level from the package logger.
 
         Args:
             level: The new logging level
 
         """
         cls._config.level = level
-        for logger in cls._loggers.values():
-            logger.setLevel(level)
+        cls._package_logger.setLevel(level)
 
     @classmethod
     def add_file_handler(cls, file_path: Path) -> None:
-        """Add a file handler to all loggers.
+        """Add a file handler to all application loggers.
+
+        The handler runs on the queue listener thread and only accepts records
+        from the package's loggers.
 
         Args:
             file_path: Path to the log file
@@ -137,10 +160,13 @@ class LoggerManager:
             formatter = logging.Formatter(cls._config.format, cls._config.date_format)
             file_handler = logging.FileHandler(file_path)
             file_handler.setFormatter(formatter)
+            file_handler.addFilter(logging.Filter(cls._package_logger.name))
 
-            for logger in cls._loggers.values():
-                logger.addHandler(file_handler)
+            cls._queue_handler(file_handler)
 
             cls._config.file_path = file_path
         except Exception as e:
             cls.get_logger("LoggerManager").error(f"Failed to add file handler: {e}")
+
+
+LoggerManager.initialize()
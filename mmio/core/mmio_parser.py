@@ -1,16 +1,18 @@
 """MMIO Parser module."""
 
-from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from io import StringIO
+from itertools import islice
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from mmio.core.exceptions import (
     FileAccessError,
     MMIOParserError,
 )
 from mmio.core.logger import LoggerManager
-from mmio.core.parse_logic import MMIOParseLogic
+from mmio.core.parse_logic import LINE_PATTERN, MMIOParseLogic, ParsedLine
 
 logger = LoggerManager.get_logger(__name__)
 
@@ -29,14 +31,17 @@ class MMIOParser(BaseModel):
     model_config = ConfigDict(arbitrary_types_allowed=True, validate_assignment=True)
     parse_logic: MMIOParseLogic = Field(default_factory=MMIOParseLogic)
 
-    def parse_content(self, content: str) -> list[dict[str, Any]]:
-        """Parse MMIO content and return a list of parsed data as dictionaries.
+    _invalid_rows: list[ParsedLine] = PrivateAttr(default_factory=list)
+
+    @staticmethod
+    def parse_content(content: str) -> list[ParsedLine]:
+        """Parse MMIO content and return a list of parsed records.
 
         Args:
             content: MMIO log content to parse
 
         Returns:
-            List of dictionaries containing parsed MMIO operations, including:
+            List of ParsedLine records containing parsed MMIO operations, including:
             - All original fields from parse_line
             - read_value/write_value: Operation-specific values
             - read_address/write_address: Operation-specific addresses (shifted)
@@ -45,49 +50,103 @@ class MMIOParser(BaseModel):
             FileAccessError: If content is empty
             MMIOParserError: For unexpected errors
 
+        """
+        if not content.strip():
+            logger.info("Skipping empty content")
+            return []
+
+        return list(MMIOParser().parse_stream(StringIO(content)))
+
+    def parse_stream(self, lines: Iterable[str], batch_size: int = 65536) -> Iterator[ParsedLine]:
+        """Parse MMIO log lines lazily, yielding one record per valid line.
+
+        Lines are aligned in batches of ``batch_size``, so memory use stays bounded
+        regardless of the size of the log.
+
+        Args:
+            lines: Iterable of log lines, e.g. an open file handle
+            batch_size: Number of matched lines aligned at once
+
+        Yields:
+            ParsedLine records, as returned by parse_content
+
+        Raises:
+            FileAccessError: If the underlying file cannot be read
+            MMIOParserError: For unexpected errors
+
         """
         try:
-            if not content.strip():
-                logger.info("Skipping empty content")
-                return []
-
-            lines: list[str] = content.splitlines()
-            parsed_data: list[dict[str, Any]] = []
-
-            for line_number, line in enumerate(iterable=lines, start=1):
-                if not (line.startswith("R") or line.startswith("W")):
-                    logger.info(f"Skipped non-R/W line {line_number}: {line[:40]}...")
-                    continue
-
-                try:
-                    parsed_line_dict: OrderedDict[str, Any] = (
-                        self.parse_logic.parse_line(line)
-                    )
-                    logger.info(
-                        f"Parsed line: {parsed_line_dict['operation']}, {parsed_line_dict['address']}, {parsed_line_dict['value']}"
-                    )
-                    value = parsed_line_dict["value"]
-                    num = int(value, 16)
-                    value = f"{num:08X}"
-                    logger.info(f"Parsed value: {value}")
-
-                    parsed_data.append(
-                        {
-                            "operation": parsed_line_dict["operation"],
-                            "counter": parsed_line_dict["counter"],
-                            "timestamp": float(parsed_line_dict["timestamp"]),
-                            "bar": int(parsed_line_dict["bar_number"]),
-                            "address": parsed_line_dict["address"],
-                            "value": value,
-                        }
-                    )
-                    logger.info(f"Parsed data: {parsed_data[-1]}")
-                except (ValueError, KeyError) as e:
-                    logger.info(f"Skipped invalid line {line_number}: {str(e)}")
-                    continue
-
-            return parsed_data
+            parsed_count = 0
+            matched_count = 0
+
+            for rows in self._batch_groups(lines, batch_size):
+                entries = self._build_entries(rows)
+                matched_count += len(rows)
+                parsed_count += len(entries)
+                yield from entries
+
+            logger.info(f"Parsed {parsed_count} lines, skipped {matched_count - parsed_count} invalid lines")
         except FileAccessError:
             raise
         except Exception as e:
             raise MMIOParserError(f"Unexpected error: {str(e)}")
+
+    def parse_valid_rows(self, lines: Iterable[str], batch_size: int = 65536) -> Iterator[ParsedLine]:
+        """Parse MMIO log lines lazily, yielding only records that VerilogData accepts.
+
+        Records with a BAR outside 0-9 or a negative timestamp are set aside instead of
+        yielded; retrieve them with collect_invalid_rows once the stream is exhausted.
+
+        Args:
+            lines: Iterable of log lines, e.g. an open file handle
+            batch_size: Number of matched lines aligned at once
+
+        Yields:
+            Prevalidated ParsedLine records
+
+        """
+        invalid: list[ParsedLine] = []
+        self._invalid_rows = invalid
+        is_valid_record = self.parse_logic.is_valid_record
+        for record in self.parse_stream(lines, batch_size):
+            if is_valid_record(record):
+                yield record
+            else:
+                invalid.append(record)
+
+    def collect_invalid_rows(self) -> list[ParsedLine]:
+        """Get the records rejected by the last parse_valid_rows run."""
+        return self._invalid_rows
+
+    @staticmethod
+    def _batch_groups(lines: Iterable[str], batch_size: int) -> Iterator[list[tuple[str | Any, ...]]]:
+        """Group the LINE_PATTERN captures of matching lines into batches."""
+        matches = filter(None, map(LINE_PATTERN.match, lines))
+        while batch := [match.groups() for match in islice(matches, batch_size)]:
+            yield batch
+
+    def _build_entries(self, rows: list[tuple[str | Any, ...]]) -> list[ParsedLine]:
+        """Build parsed records for a batch of LINE_PATTERN captures, dropping invalid rows.
+
+        The whole batch is built in a single comprehension; only a batch that contains an
+        invalid row is rebuilt row by row.
+        """
+        _, _, _, _, addresses, values = zip(*rows)
+        aligned, shifted = self.parse_logic.align_batch(addresses, values)
+
+        columns = zip(rows, aligned, shifted)
+        try:
+            return [
+                ParsedLine(operation, int(counter), float(timestamp), int(bar), address, value)
+                for (operation, counter, timestamp, bar, _, _), address, value in columns
+            ]
+        except ValueError:
+            pass
+
+        entries: list[ParsedLine] = []
+        for (operation, counter, timestamp, bar, _, _), address, value in zip(rows, aligned, shifted):
+            try:
+                entries.append(ParsedLine(operation, int(counter), float(timestamp), int(bar), address, value))
+            except ValueError:
+                continue
+        return entries
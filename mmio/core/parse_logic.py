@@ -1,7 +1,11 @@
 """Patterns for MMIO parsing."""
 
-from collections import OrderedDict
-from typing import Any
+import math
+import re
+import struct
+import sys
+from collections.abc import Sequence
+from typing import NamedTuple
 
 from pydantic import BaseModel
 
@@ -9,6 +13,58 @@ from mmio.core.logger import LoggerManager
 
 logger = LoggerManager.get_logger(__name__)
 
+__all__: list[str] = [
+    "LINE_PATTERN",
+    "OP_READ",
+    "OP_WRITE",
+    "MMIOParseLogic",
+    "ParsedLine",
+]
+
+LINE_PATTERN: re.Pattern[str] = re.compile(
+    r"^([WR])[^\S\n]+(\d+)[^\S\n]+(\S+)[^\S\n]+(\d+)[^\S\n]+(0x[0-9a-fA-F]+)[^\S\n]+(0x[0-9a-fA-F]+)"
+    r"[^\S\n]+\S+[^\S\n]+\S+[^\S\n]*$",
+    re.MULTILINE,
+)
+"""Matches a complete 8-field read/write line; other lines in the log never match."""
+
+_HEX_RE: re.Pattern[str] = re.compile(r"0x[0-9a-fA-F]+\Z")
+
+OP_WRITE: str = sys.intern("W")
+OP_READ: str = sys.intern("R")
+
+
+def _build_offset_tables() -> tuple[bytes, tuple[str, ...]]:
+    """Build the shift and base-digit lookup tables indexed by the ordinal of a hex digit."""
+    shifts = bytearray(256)
+    bases = [""] * 256
+    for nibble in range(16):
+        for char in (f"{nibble:x}", f"{nibble:X}"):
+            shifts[ord(char)] = (nibble & 0x3) * 8
+            bases[ord(char)] = f"{nibble & 0xC:x}"
+    return bytes(shifts), tuple(bases)
+
+
+_SHIFT_LUT, _BASE_LUT = _build_offset_tables()
+"""Byte-lane shift and word-aligned digit for the last hex digit of an address, indexed by its ordinal."""
+
+
+def _first_non_ws(line: str) -> str:
+    """Return the first non-whitespace character of a line, or an empty string."""
+    first = line[:1]
+    return line.lstrip()[:1] if first.isspace() else first
+
+
+class ParsedLine(NamedTuple):
+    """A single parsed MMIO read/write operation."""
+
+    operation: str
+    counter: int
+    timestamp: float
+    bar: int
+    address: str
+    value: str
+
 
 class MMIOParseLogic(BaseModel):
     """Patterns for MMIO parsing.
@@ -19,115 +75,89 @@ class MMIOParseLogic(BaseModel):
     """
 
     @staticmethod
-    def address_offset_shift(
-        address: str,
-        offset: str,
-    ) -> list[tuple[str, int]]:
-        """Convert offset addresses to base address."""
-        offset_to_base: dict[str, str] = {
-            offset: base
-            for base, offset in {
-                "0": "1230",
-                "4": "5674",
-                "8": "9ab8",
-                "c": "defc",
-            }.items()
-            for offset in offset
-        }
-
-        shift_map: dict[int, str] = {
-            0: "048c",
-            8: "159d",
-            16: "26ae",
-            24: "37bf",
-        }
-
-        offset = offset.lower()
-        base = offset_to_base.get(offset)
-
-        base_addr = f"{address[:-1]}{base}"
-        shift = next((k for k, v in shift_map.items() if offset in v), 0)
-
-        return [(base_addr, shift)]
-
-    @classmethod
     def align_register_to_offset(
-        cls,
         address: str,
         value: str,
     ) -> tuple[str, str]:
         """Aligns register value based on address offset."""
-        last_char = address[-1]
-        base_addr, shift_amount = cls.address_offset_shift(address[2:], last_char)[0]
-        value_int = int(value, 16)
-        hex_value = f"{(value_int << shift_amount) & 0xFFFFFFFF:08x}"
-        return base_addr, hex_value
+        last = ord(address[-1])
+        return address[2:-1] + _BASE_LUT[last], f"{(int(value, 16) << _SHIFT_LUT[last]) & 0xFFFFFFFF:08X}"
+
+    @staticmethod
+    def align_batch(addresses: Sequence[str], values: Sequence[str]) -> tuple[list[str], list[str]]:
+        """Align a column of addresses and their values in one pass.
+
+        Args:
+            addresses: Register addresses with a 0x prefix
+            values: Register values with a 0x prefix, same length as addresses
+
+        Returns:
+            Tuple of (aligned addresses, shifted uppercase hex values)
+
+        """
+        lasts = [ord(address[-1]) for address in addresses]
+        aligned = [address[2:-1] + _BASE_LUT[last] for address, last in zip(addresses, lasts)]
+        shifted = [(int(value, 16) << _SHIFT_LUT[last]) & 0xFFFFFFFF for value, last in zip(values, lasts)]
+        return aligned, MMIOParseLogic.format_hex32_batch(shifted)
+
+    @staticmethod
+    def format_hex32_batch(numbers: Sequence[int]) -> list[str]:
+        """Format 32-bit integers as 8-digit uppercase hex strings in one pass.
+
+        The numbers are packed big-endian and hex-encoded as a single buffer, which is
+        then sliced per value.
+
+        Args:
+            numbers: Integers in the range 0..0xFFFFFFFF
+
+        Returns:
+            List of 8-digit uppercase hex strings, in input order
+
+        """
+        digits = struct.pack(f">{len(numbers)}I", *numbers).hex().upper()
+        return [digits[i : i + 8] for i in range(0, len(digits), 8)]
 
     @staticmethod
     def is_valid_hex(value: str) -> bool:
         """Check if a string is a valid hexadecimal value starting with 0x."""
-        try:
-            if not value.startswith("0x"):
-                return False
-            int(value, 16)
-            return True
-        except ValueError:
-            return False
+        return _HEX_RE.match(value) is not None
+
+    @staticmethod
+    def is_valid_record(record: ParsedLine) -> bool:
+        """Check that a parsed record has a BAR in 0-9 and a finite, non-negative timestamp."""
+        return 0 <= record.bar <= 9 and math.isfinite(record.timestamp) and record.timestamp >= 0
 
     @staticmethod
     def is_valid_line(line: str) -> bool:
-        """Check if line starts with W or R and has the correct format."""
-        return line.strip().startswith(("W", "R"))
+        """Check if line starts with W or R."""
+        return _first_non_ws(line) in ("W", "R")
 
     @staticmethod
     def is_write(line: str) -> bool:
         """Check if line is a write operation."""
-        return line.strip().startswith("W")
+        return _first_non_ws(line) == "W"
 
     @staticmethod
     def is_read(line: str) -> bool:
         """Check if line is a read operation."""
-        return line.strip().startswith("R")
-
-    @staticmethod
-    def bar_number(
-        parts: list[str],
-        base_addr: str,
-        value: str,
-    ) -> int:
-        """Get the bar number from line parts with base address and value validation."""
-        return int(parts[3])
+        return _first_non_ws(line) == "R"
 
     @staticmethod
     def validate_line_format(line: str) -> list[str]:
         """Validate line format and split into parts."""
-        if not MMIOParseLogic.is_valid_line(line):
+        parts = line.split()
+        if not parts or parts[0][0] not in ("W", "R"):
             raise ValueError("Invalid line format - must start with W or R")
 
-        parts = line.strip().split()
         if len(parts) != 8:
             raise ValueError("Invalid line format - expected 8 fields")
 
-        for hex_value in [parts[4], parts[5]]:
+        for hex_value in (parts[4], parts[5]):
             if not MMIOParseLogic.is_valid_hex(hex_value):
                 raise ValueError(f"Invalid hex value: {hex_value}")
 
         return parts
 
-    @staticmethod
-    def process_address(address: str) -> tuple[str, str, int]:
-        """Process address to get base address and shift amount."""
-        address = address[2:]
-        if len(address) < 1:
-            raise ValueError(f"Invalid address format: {address}")
-
-        last_char = address[-1]
-        base_addr, shift_amount = MMIOParseLogic.address_offset_shift(
-            address, last_char
-        )[0]
-
-        return base_addr, address, shift_amount
-
     @staticmethod
     def create_mmio_data(
         parts: list[str],
@@ -135,44 +165,25 @@ class MMIOParseLogic(BaseModel):
         bar: int,
         address: str,
         value: str,
-    ) -> OrderedDict[str, Any]:
-        """Create MMIO data dictionary from parsed components."""
+    ) -> ParsedLine:
+        """Create a parsed MMIO record from parsed components."""
         try:
-            return OrderedDict(
-                [
-                    ("operation", operation),
-                    ("counter", int(parts[1])),
-                    ("timestamp", float(parts[2])),
-                    ("bar_number", bar),
-                    ("address", address),
-                    ("value", value),
-                ]
-            )
+            return ParsedLine(operation, int(parts[1]), float(parts[2]), bar, address, value)
 
         except (ValueError, IndexError) as e:
             raise ValueError(f"Error creating MMIO data: {str(e)}")
 
     @staticmethod
-    def parse_line(line: str) -> OrderedDict[str, Any]:
+    def parse_line(line: str) -> ParsedLine:
         """Parse a valid line into its components."""
         parts = MMIOParseLogic.validate_line_format(line)
-        operation = "W" if MMIOParseLogic.is_write(line) else "R"
-
-        base_addr, address, shift_amount = MMIOParseLogic.process_address(parts[4])
-        bar = MMIOParseLogic.bar_number(
-            parts,
-            base_addr,
-            parts[5],
-        )
-        aligned_address, shifted_value = MMIOParseLogic.align_register_to_offset(
-            parts[4],
-            parts[5],
-        )
+        operation = OP_WRITE if parts[0][0] == "W" else OP_READ
+        aligned_address, shifted_value = MMIOParseLogic.align_register_to_offset(parts[4], parts[5])
 
         return MMIOParseLogic.create_mmio_data(
             parts,
             operation,
-            bar,
+            int(parts[3]),
             aligned_address,
             shifted_value,
         )
@@ -1,68 +1,132 @@
+from __future__ import annotations
+
 from typing import Any, ClassVar
 
 from pydantic import BaseModel, ConfigDict, field_validator
 
 from mmio.core.exceptions import ValidationError
 from mmio.core.logger import LoggerManager
+from mmio.core.parse_logic import ParsedLine
 
 logger = LoggerManager.get_logger(__name__)
 
 
-class _MMIOTracker:
-    """Internal tracker for MMIO data and statistics."""
+def _canon_hex(value: str, width: int) -> str | None:
+    """Format a hex string, with or without 0x, as zero-padded uppercase hex; None if invalid."""
+    try:
+        return f"{int(value.removeprefix('0x'), 16):0{width}X}"
+    except ValueError:
+        return None
 
-    all_instances: list["VerilogData"] = []
-    address_bit_widths: dict[str, int] = {}
-    default_values: dict[int, tuple[str, str]] = {}
 
-    @classmethod
-    def add_instance(cls, instance: "VerilogData") -> None:
-        """Add a VerilogData instance to tracking."""
-        cls.all_instances.append(instance)
+def _build_lead_pad() -> bytes:
+    """Build the table of unused high bits in a leading hex digit, indexed by its ordinal."""
+    pad = bytearray(256)
+    for nibble in range(1, 16):
+        for char in (f"{nibble:x}", f"{nibble:X}"):
+            pad[ord(char)] = 4 - nibble.bit_length()
+    return bytes(pad)
 
-    @classmethod
-    def update_address_bit_width(cls, address: str | None, value: str | None) -> None:
-        """Update the maximum bit width needed for a given address."""
-        if address is None or value is None:
-            return
 
-        current_width = VerilogData.calculate_bit_width(value)
-        existing_width = cls.address_bit_widths.get(address, 0)
-        cls.address_bit_widths[address] = max(current_width, existing_width)
+_LEAD_PAD = _build_lead_pad()
 
-    @classmethod
-    def update_default_values(cls, bar: int | None, operation: str | None, value: str | None) -> None:
+
+def _canon_bit_width(value: str) -> int:
+    """Bit width of a canonical hex string (no 0x, valid digits) without converting it to int."""
+    digits = value.lstrip("0")
+    return len(digits) * 4 - _LEAD_PAD[ord(digits[0])] if digits else 1
+
+
+class _MMIOTracker:
+    """Internal tracker for MMIO data and statistics.
+
+    Besides the instances themselves, the fields used by the BAR queries are kept
+    in parallel columns, so those queries scan plain lists instead of model attributes.
+    """
+
+    __slots__ = (
+        "address_bit_widths",
+        "addresses",
+        "all_instances",
+        "bars",
+        "bit_widths_flushed",
+        "default_values",
+        "operations",
+        "values",
+    )
+
+    def __init__(self) -> None:
+        """Initialize an empty tracker."""
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all tracked instances and derived statistics."""
+        self.all_instances: list[VerilogData] = []
+        self.operations: list[str | None] = []
+        self.bars: list[int | None] = []
+        self.addresses: list[str | None] = []
+        self.values: list[str | None] = []
+        self.address_bit_widths: dict[str, int] = {}
+        self.bit_widths_flushed: int = 0
+        self.default_values: dict[int, tuple[str, str]] = {}
+
+    def add_instance(self, instance: VerilogData) -> None:
+        """Add a VerilogData instance to tracking."""
+        self.all_instances.append(instance)
+        self.operations.append(instance.operation)
+        self.bars.append(instance.bar)
+        self.addresses.append(instance.address)
+        self.values.append(instance.value)
+
+    def flush_bit_widths(self) -> dict[str, int]:
+        """Fold the rows tracked since the last flush into address_bit_widths.
+
+        Bit widths are reduced once, when they are read, rather than on every added instance.
+        Tracked values are already canonical hex, so their widths come from the leading digit.
+        """
+        start = self.bit_widths_flushed
+        if start < len(self.addresses):
+            widths = self.address_bit_widths
+            for address, value in zip(self.addresses[start:], self.values[start:]):
+                if address is None or value is None:
+                    continue
+                width = _canon_bit_width(value)
+                if width > widths.get(address, 0):
+                    widths[address] = width
+            self.bit_widths_flushed = len(self.addresses)
+        return self.address_bit_widths
+
+    def update_default_values(self, bar: int | None, operation: str | None, value: str | None) -> None:
         """Update default values for a BAR based on new value."""
         if bar is None or operation is None or value is None:
             return
 
-        if bar not in cls.default_values:
-            cls.default_values[bar] = ("00000000", "00000000")
-
-        current_defaults = cls.default_values[bar]
+        read_default, write_default = self.default_values.get(bar, ("00000000", "00000000"))
         if operation == "R":
-            cls.default_values[bar] = (value, current_defaults[1])
+            self.default_values[bar] = (value, write_default)
         else:
-            cls.default_values[bar] = (current_defaults[0], value)
+            self.default_values[bar] = (read_default, value)
 
-    @classmethod
-    def get_default_values(cls, bar: int) -> tuple[str, str]:
+    def get_default_values(self, bar: int) -> tuple[str, str]:
         """Get default read/write values for a BAR."""
-        return cls.default_values.get(bar, ("00000000", "00000000"))
+        return self.default_values.get(bar, ("00000000", "00000000"))
 
-    @classmethod
-    def get_bar_address_bit_widths(cls, bar: int) -> dict[str, int]:
+    def get_bar_address_bit_widths(self, bar: int) -> dict[str, int]:
         """Get all addresses and their bit widths for a specific BAR."""
         bar_addresses = set(VerilogData.addresses(bar=bar))
-        return {addr: width for addr, width in cls.address_bit_widths.items() if addr in bar_addresses}
+        return {addr: width for addr, width in self.flush_bit_widths().items() if addr in bar_addresses}
+
+
+_TRACKER = _MMIOTracker()
+"""Process-wide tracker shared by all VerilogData instances."""
 
 
 class VerilogData(BaseModel):
     """Data class for MMIO data."""
 
-    model_config = ConfigDict(arbitrary_types_allowed=True, validate_assignment=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
-    _tracker: ClassVar[_MMIOTracker] = _MMIOTracker()
+    _tracker: ClassVar[_MMIOTracker] = _TRACKER
 
     operation: str | None = None
     bar: int | None = None
@@ -73,11 +137,11 @@ class VerilogData(BaseModel):
     description: str | None = None
 
     @classmethod
-    def from_dict(cls, data_dict: dict[str, Any]) -> "VerilogData":
+    def from_dict(cls, data_dict: dict[str, Any] | ParsedLine) -> VerilogData:
         """Create a VerilogData instance from a dictionary and update class tracking.
 
         Args:
-            data_dict: Dictionary containing the MMIO data fields
+            data_dict: Dictionary containing the MMIO data fields, or a ParsedLine record
 
         Returns:
             VerilogData instance with all class tracking updated
@@ -86,6 +150,9 @@ class VerilogData(BaseModel):
             ValidationError: If the data is invalid
 
         """
+        if isinstance(data_dict, ParsedLine):
+            return cls.from_parsed_line(data_dict)
+
         try:
             if "bar" in data_dict and data_dict["bar"] is not None:
                 data_dict["bar"] = int(data_dict["bar"])
@@ -106,58 +173,105 @@ class VerilogData(BaseModel):
                 description=data_dict.get("description"),
             )
 
-            instance.format_and_validate()
+            return cls._track(instance)
+        except Exception as e:
+            logger.error(f"Error creating VerilogData from dict: {e}")
+            raise ValidationError(f"Failed to create VerilogData: {str(e)}")
 
-            cls._tracker.add_instance(instance)
+    @classmethod
+    def from_parsed_line(cls, line: ParsedLine) -> VerilogData:
+        """Create a VerilogData instance from a parsed MMIO record and update class tracking.
 
-            if instance.address is not None and instance.value is not None:
-                cls._tracker.update_address_bit_width(instance.address, instance.value)
+        The record's fields are already typed by the parser, so no coercion is needed.
 
-            if instance.bar is not None and instance.operation is not None and instance.value is not None:
-                cls._tracker.update_default_values(instance.bar, instance.operation, instance.value)
+        Args:
+            line: Parsed MMIO record
 
-            return instance
-        except Exception as e:
-            logger.error(f"Error creating VerilogData from dict: {e}")
-            raise ValidationError(f"Failed to create VerilogData: {str(e)}")
+        Returns:
+            VerilogData instance with all class tracking updated
+
+        Raises:
+            ValidationError: If the data is invalid
+
+        """
+        try:
+            instance = cls(
+                operation=line.operation,
+                bar=line.bar,
+                value=line.value,
+                address=line.address,
+                timestamp=line.timestamp,
+            )
+
+            return cls._track(instance)
+        except (ValueError, TypeError, OverflowError) as e:
+            logger.error(f"Error creating VerilogData from parsed line: {e}")
+            raise ValidationError(f"Failed to create VerilogData: {e}")
+
+    @classmethod
+    def _track(cls, instance: VerilogData) -> VerilogData:
+        """Format and validate a new instance, then add it to class tracking."""
+        instance.format_and_validate()
+
+        cls._tracker.add_instance(instance)
+
+        if instance.bar is not None and instance.operation is not None and instance.value is not None:
+            cls._tracker.update_default_values(instance.bar, instance.operation, instance.value)
+
+        return instance
 
     def format_and_validate(self) -> None:
-        """Format all values and validate them."""
-        if self.value is not None:
-            self.value = self.remove_0x(self.value, self.address)
-        if self.register_value is not None:
-            self.register_value = self.remove_0x(self.register_value, self.address)
-        if self.address is not None:
-            self.address = self.remove_0x(self.address, None)
-
-        if self.address is not None:
-            self.address = self.format_value(self.address, is_address=True)
-        if self.value is not None:
-            self.value = self.format_value(self.value, is_address=False)
-        if self.register_value is not None:
-            self.register_value = self.format_value(self.register_value, is_address=False)
-        if self.timestamp is not None:
-            self.timestamp = self.normalize_timestamp(self.timestamp)
-
-        if self.bar is not None:
-            self.bar = self.validate_bar(self.bar)
-        if self.operation is not None:
-            self.operation = self.validate_operation(self.operation)
-        if self.address is not None:
-            self.address = self.validate_address(self.address)
-        if self.register_value is not None:
-            self.register_value = self.validate_register_value(self.register_value)
-        self.timestamp = self.validate_timestamp(self.timestamp)
+        """Format all values and validate them.
+
+        Values are normalized into locals and each field is assigned once; assignment
+        is not re-validated, so every validator runs exactly once here.
+        """
+        operation = self.operation
+        bar = self.bar
+        address = self.address
+        value = self.value
+        register_value = self.register_value
+        timestamp = self.timestamp
+
+        if address is not None:
+            address = _canon_hex(address, 5)
+        if value is not None:
+            value = _canon_hex(value, 8)
+        if register_value is not None:
+            register_value = _canon_hex(register_value, 8)
+        if timestamp is not None:
+            timestamp = float(self.normalize_timestamp(timestamp))
+
+        if bar is not None:
+            bar = self.validate_bar(bar)
+        if operation is not None:
+            operation = self.validate_operation(operation)
+        if address is not None:
+            address = self.validate_address(address)
+        if register_value is not None:
+            register_value = self.validate_register_value(register_value)
+
+        self.operation = operation
+        self.bar = bar
+        self.address = address
+        self.value = value
+        self.register_value = register_value
+        self.timestamp = self.validate_timestamp(timestamp)
+
+    @classmethod
+    def reset_tracking(cls) -> None:
+        """Clear all tracked instances and statistics, e.g. between runs in one process."""
+        cls._tracker.reset()
 
     @classmethod
-    def get_all_instances(cls) -> list["VerilogData"]:
+    def get_all_instances(cls) -> list[VerilogData]:
         """Get all VerilogData instances."""
         return cls._tracker.all_instances
 
     @classmethod
     def get_address_bit_widths(cls) -> dict[str, int]:
         """Get all address bit widths."""
-        return cls._tracker.address_bit_widths
+        return cls._tracker.flush_bit_widths()
 
     @classmethod
     def get_default_values(cls, bar: int) -> tuple[str, str]:
@@ -229,12 +343,9 @@ class VerilogData(BaseModel):
 
     @classmethod
     def normalize_timestamp(cls, timestamp: float) -> int:
-        """Strip the timestamp from a value and remove the first two integers."""
-        seconds: str = str(timestamp)[-1]
-        nanos: str = str(timestamp).split(".")[1].ljust(6, "0")
-        values: int = int(f"{seconds}{nanos}")
-        logger.info(f"Normalized timestamp: {values}")
-        return values
+        """Keep the last digit of the whole seconds followed by the microseconds."""
+        whole = int(timestamp)
+        return (whole % 10) * 1_000_000 + round((timestamp - whole) * 1_000_000)
 
     @classmethod
     def remove_0x(cls, value: str | None, address: str | None) -> str | None:
@@ -242,9 +353,9 @@ class VerilogData(BaseModel):
         if value is None and address is None:
             return None
         if value is not None:
-            return value.replace("0x", "")
+            return value.removeprefix("0x")
         if address is not None:
-            return address.replace("0x", "")
+            return address.removeprefix("0x")
         return value
 
     @classmethod
@@ -252,11 +363,7 @@ class VerilogData(BaseModel):
         """Format hex values to proper width."""
         if value is None:
             return None
-        try:
-            num = int(value, 16)
-            return f"{num:05X}" if is_address else f"{num:08X}"
-        except ValueError:
-            return None
+        return _canon_hex(value, 5 if is_address else 8)
 
     @staticmethod
     def calculate_bit_width(value: str | None) -> int:
@@ -272,26 +379,29 @@ class VerilogData(BaseModel):
     @classmethod
     def read_values(cls, bar: int | None = None) -> list[str]:
         """Get all read values, optionally filtered by BAR."""
+        tracker = cls._tracker
         return [
-            data.value
-            for data in cls._tracker.all_instances
-            if data.operation == "R" and data.value is not None and (bar is None or data.bar == bar)
+            value
+            for operation, data_bar, value in zip(tracker.operations, tracker.bars, tracker.values)
+            if operation == "R" and value is not None and (bar is None or data_bar == bar)
         ]
 
     @classmethod
     def write_values(cls, bar: int | None = None) -> list[str]:
         """Get all write values, optionally filtered by BAR."""
+        tracker = cls._tracker
         return [
-            data.value
-            for data in cls._tracker.all_instances
-            if data.operation == "W" and data.value is not None and (bar is None or data.bar == bar)
+            value
+            for operation, data_bar, value in zip(tracker.operations, tracker.bars, tracker.values)
+            if operation == "W" and value is not None and (bar is None or data_bar == bar)
         ]
 
     @classmethod
     def addresses(cls, bar: int | None = None) -> list[str]:
         """Get all addresses, optionally filtered by BAR."""
+        tracker = cls._tracker
         return [
-            data.address
-            for data in cls._tracker.all_instances
-            if data.address is not None and (bar is None or data.bar == bar)
+            address
+            for data_bar, address in zip(tracker.bars, tracker.addresses)
+            if address is not None and (bar is None or data_bar == bar)
         ]
@@ -1,12 +1,14 @@
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
 
 from pydantic import BaseModel, Field
 
+from mmio.core.exceptions import ValidationError
 from mmio.core.logger import LoggerManager
 from mmio.core.mmio_parser import MMIOParser
+from mmio.core.parse_logic import ParsedLine
 from mmio.domain.models.verilog_data import VerilogData
-from mmio.infrastructure.file_handling.mmio_filemanager import MMIOFileManager
+from mmio.infrastructure.file_handling.mmio_filemanager import MMIOFileManager, mmio_filemanager
 
 logger = LoggerManager.get_logger(__name__)
 
@@ -16,13 +18,13 @@ class InputOrchestrator(BaseModel):
 
     - Reading file(s) using MMIOFileManager.
     - Parsing the MMIO log content via MMIOParser.
-    - Converting the parsed dictionaries into VerilogData instances.
+    - Converting the parsed records into VerilogData instances.
 
     Returns a processed data structure (e.g., a dictionary of VerilogData) that will be used
     by the Verilog builder orchestrator.
     """
 
-    mmio_file_manager: MMIOFileManager = Field(default_factory=MMIOFileManager.get_instance)
+    mmio_file_manager: MMIOFileManager = Field(default_factory=lambda: mmio_filemanager)
     parser: MMIOParser = Field(default_factory=MMIOParser)
 
     def execute(self) -> dict[int, list[VerilogData]]:
@@ -30,10 +32,9 @@ class InputOrchestrator(BaseModel):
 
         Process:
             1. Read the input file path using MMIOFileManager.
-            2. Read file content.
-            3. Parse file content using MMIOParser to get a list of dictionary data.
-            4. Transform each parsed dictionary into VerilogData using from_dict.
-            5. Aggregate the data into a structured format (e.g., keyed by BAR) and return.
+            2. Stream the file line by line through MMIOParser to get prevalidated records.
+            3. Transform each record into VerilogData using from_parsed_line.
+            4. Aggregate the data into a structured format (e.g., keyed by BAR) and return.
 
         Returns:
             dict: A dictionary containing processed BAR data.
@@ -50,37 +51,29 @@ class InputOrchestrator(BaseModel):
         file_path: Path = self.mmio_file_manager.read_file()
         logger.info(f"Successfully read file: {file_path}")
 
-        content: str = file_path.read_text()
-
-        logger.info("Parsing file content")
-        parsed_results: list[dict[str, Any]] = self.parser.parse_content(content)
-
-        logger.info("Transforming parsed data to VerilogData instances")
+        logger.info("Parsing and transforming file content to VerilogData instances")
         processed_data: dict[int, list[VerilogData]] = {}
         success_count = 0
-        error_count = 0
-
-        for entry in parsed_results:
-            try:
-                verilog_data: VerilogData = VerilogData.from_dict(entry)
-                logger.info(f"Created VerilogData instance: {verilog_data}")
-
-                bar_number: int = verilog_data.bar if verilog_data.bar is not None else 0
-                if bar_number not in processed_data:
-                    processed_data[bar_number] = []
-                    logger.info(f"Created new list for BAR {bar_number}")
-                processed_data[bar_number].append(verilog_data)
+        rejected: list[ParsedLine] = []
+
+        with file_path.open(buffering=1 << 20) as handle:
+            parsed_results: Iterator[ParsedLine] = self.parser.parse_valid_rows(handle)
+            for entry in parsed_results:
+                try:
+                    verilog_data: VerilogData = VerilogData.from_parsed_line(entry)
+                except ValidationError:
+                    rejected.append(entry)
+                    continue
+                bucket = processed_data.get(entry.bar)
+                if bucket is None:
+                    bucket = processed_data[entry.bar] = []
+                bucket.append(verilog_data)
                 success_count += 1
 
-                if success_count % 100 == 0:
-                    logger.info(f"Processed {success_count} entries successfully")
-            except Exception as e:
-                error_count += 1
-                logger.error(f"Error processing entry: {e}")
-                logger.info(f"Problematic entry: {entry}")
-
-        if error_count > 0:
-            logger.warning(f"Failed to process {error_count} entries")
+        invalid_rows = [*self.parser.collect_invalid_rows(), *rejected]
+        logger.info("Processed %d entries (%d invalid rows)", success_count, len(invalid_rows))
+        if invalid_rows:
+            logger.warning("%d invalid rows, first: %s", len(invalid_rows), invalid_rows[0])
 
         logger.info(f"Final processed data contains {len(processed_data)} BARs")
         for bar_num, entries in processed_data.items():
@@ -1,5 +1,8 @@
 """Orchestrator to manage all modules."""
 
+import logging
+from functools import cached_property
+
 from pydantic import BaseModel, ConfigDict, Field
 
 from mmio.application.cli.app import AppLogic
@@ -8,8 +11,8 @@ from mmio.config.mmio_settings import MMIOSettings
 from mmio.config.verilog_settings import VerilogSettings
 from mmio.core.logger import LoggerManager
 from mmio.domain.models.verilog_data import VerilogData
-from mmio.infrastructure.file_handling.mmio_filemanager import MMIOFileManager
-from mmio.infrastructure.file_handling.verilog_filemanager import VerilogFileManager
+from mmio.infrastructure.file_handling.mmio_filemanager import MMIOFileManager, mmio_filemanager
+from mmio.infrastructure.file_handling.verilog_filemanager import VerilogFileManager, verilog_filemanager
 
 logger = LoggerManager.get_logger(__name__)
 
@@ -21,7 +24,12 @@ class MainOrchestrator(BaseModel):
     application flow. It handles initialization of components and ensures
     proper interaction between them.
 
-    Attributes:
+    The components below are cached properties, built or resolved on first access,
+    so constructing the orchestrator does not build the whole graph. They are not
+    model fields and cannot be passed to the constructor; unknown keyword arguments
+    are rejected.
+
+    Components:
         verilog_settings: VerilogSettings to configure Verilog output
         mmio_settings: MMIOSettings to configure MMIO input
         app_logic: AppLogic to handle CLI interactions
@@ -30,71 +38,96 @@ class MainOrchestrator(BaseModel):
         mmio_file_manager: MMIOFileManager to handle MMIO file input
         verilog_file_manager: VerilogFileManager to handle Verilog file output
 
-    """
-
-    model_config = ConfigDict(arbitrary_types_allowed=True, validate_assignment=True)
-
-    verilog_data: VerilogData = Field(default_factory=VerilogData)
-
-    verilog_settings: VerilogSettings = Field(default_factory=VerilogSettings.get_instance)
-    mmio_settings: MMIOSettings = Field(default_factory=MMIOSettings.get_instance)
+    Attributes:
+        results: Processed result rows
 
-    app_logic: AppLogic = Field(default_factory=AppLogic)
-    mmio_cli_manager: MMIOCLIManager = Field(default_factory=MMIOCLIManager)
+    """
 
-    mmio_file_manager: MMIOFileManager = Field(default_factory=MMIOFileManager.get_instance)
-    verilog_file_manager: VerilogFileManager = Field(default_factory=VerilogFileManager.get_instance)
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
 
     results: list[dict[str, str | int | float | None]] = Field(default_factory=list)
 
+    @cached_property
+    def verilog_data(self) -> VerilogData:
+        """VerilogData to handle Verilog data, built on first use."""
+        return VerilogData()
+
+    @cached_property
+    def verilog_settings(self) -> VerilogSettings:
+        """VerilogSettings singleton, resolved on first use."""
+        return VerilogSettings.get_instance()
+
+    @cached_property
+    def mmio_settings(self) -> MMIOSettings:
+        """MMIOSettings singleton, resolved on first use."""
+        return MMIOSettings.get_instance()
+
+    @cached_property
+    def app_logic(self) -> AppLogic:
+        """AppLogic to handle CLI interactions, built on first use."""
+        return AppLogic()
+
+    @cached_property
+    def mmio_cli_manager(self) -> MMIOCLIManager:
+        """MMIOCLIManager to handle MMIO CLI interactions, built on first use."""
+        return MMIOCLIManager()
+
+    @cached_property
+    def mmio_file_manager(self) -> MMIOFileManager:
+        """MMIOFileManager singleton, resolved on first use."""
+        return mmio_filemanager
+
+    @cached_property
+    def verilog_file_manager(self) -> VerilogFileManager:
+        """VerilogFileManager singleton, resolved on first use."""
+        return verilog_filemanager
+
     def _init_mmio_file_manager(self) -> None:
-        logger.info(f"MMIO settings - file_input_path: {self.mmio_settings.file_input_path}")
-        if self.mmio_settings.file_input_path:
-            logger.info(f"Setting MMIO file manager input path: {self.mmio_settings.file_input_path}")
-            self.mmio_file_manager.input_manager.file_manager.path = self.mmio_settings.file_input_path
+        """Initialize MMIO file manager with current settings."""
+        input_path = self.mmio_settings.file_input_path
+        if input_path:
+            self.mmio_file_manager.input_manager.file_manager.path = input_path
+            logger.info("Set MMIO file manager input path: %s", input_path, extra={"mmio_path": input_path})
         else:
             logger.warning("No MMIO input path set in settings")
-        logger.info(
-            f"Verilog settings - output_path: "
-            f"{self.verilog_settings.file_output_path}, "
-            f"output_name: {self.verilog_settings.file_output_name}"
-        )
 
     def _init_verilog_file_manager(self) -> None:
         """Initialize Verilog file manager with current settings."""
-        logger.info(
-            f"Verilog settings - output_path: "
-            f"{self.verilog_settings.file_output_path}, "
-            f"output_name: {self.verilog_settings.file_output_name}"
-        )
-        if self.verilog_settings.file_output_path:
-            logger.info(f"Setting Verilog file manager output path: {self.verilog_settings.file_output_path}")
-            self.verilog_file_manager.output_manager.file_manager.path = self.verilog_settings.file_output_path
+        output_path = self.verilog_settings.file_output_path
+        if output_path:
+            self.verilog_file_manager.output_manager.file_manager.path = output_path
+            logger.info("Set Verilog file manager output path: %s", output_path, extra={"verilog_path": output_path})
         else:
             logger.warning("No Verilog output path set in settings")
 
     def _generate_output_filename(self) -> None:
         """Generate output filename if not already set."""
-        if self.verilog_settings.file_output_name:
-            logger.info(f"Setting Verilog file manager output name: {self.verilog_settings.file_output_name}")
-            self.verilog_file_manager.output_manager.file_manager.file_name = self.verilog_settings.file_output_name
+        output_name = self.verilog_settings.file_output_name
+        if output_name:
+            logger.info("Setting Verilog file manager output name: %s", output_name)
+            self.verilog_file_manager.output_manager.file_manager.file_name = output_name
         else:
             logger.info("Generating default Verilog output filename")
             self.verilog_file_manager.generate_output_filename()
 
     def _log_file_managers_state(self) -> None:
-        """Log the state of the file managers."""
-        logger.info(
-            f"Final MMIO file manager state - input_path: "
-            f"{self.mmio_file_manager.input_manager.file_manager.path}, "
-            f"input_file_name: {self.mmio_file_manager.input_manager.file_manager.file_name}"
-        )
+        """Log the state of the file managers as a single record."""
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        input_fm = self.mmio_file_manager.input_manager.file_manager
+        output_fm = self.verilog_file_manager.output_manager.file_manager
+        state = {
+            "mmio_path": input_fm.path,
+            "mmio_name": input_fm.file_name,
+            "verilog_path": output_fm.path,
+            "verilog_name": output_fm.file_name,
+        }
         logger.info(
-            f"Final Verilog file manager state - output_path: "
-            f"{self.verilog_file_manager.output_manager.file_manager.path}, "
-            f"output_file_name: {self.verilog_file_manager.output_manager.file_manager.file_name}"
+            "File managers initialized - input: %(mmio_path)s / %(mmio_name)s, "
+            "output: %(verilog_path)s / %(verilog_name)s",
+            state,
+            extra=state,
         )
-        logger.info("File managers initialized")
 
     def _initialize_file_managers(self) -> None:
         """Initialize file managers with current settings."""
@@ -122,7 +155,7 @@ class MainOrchestrator(BaseModel):
 
             logger.info("Application components initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize components: {e}")
+            logger.error("Failed to initialize components: %s", e)
             raise
 
     def _run_cli_interface(self) -> None:
@@ -131,23 +164,26 @@ class MainOrchestrator(BaseModel):
 
     def _write_verilog_to_file(self) -> None:
         """Write the Verilog code to file."""
-        if self.verilog_settings.file_output_path:
-            self.verilog_file_manager.output_manager.file_manager.path = self.verilog_settings.file_output_path
-            logger.info(f"Writing Verilog output to {self.verilog_file_manager.output_manager.file_manager.path}")
+        output_path = self.verilog_settings.file_output_path
+        if output_path:
+            file_manager = self.verilog_file_manager.output_manager.file_manager
+            if file_manager.path != output_path:
+                file_manager.path = output_path
+            logger.info("Writing Verilog output to %s", file_manager.path)
 
     def generate_output(self) -> None:
         """Generate Verilog output from processed results."""
         try:
             logger.info("Generating Verilog output")
 
-            if not self.verilog_settings.file_output_name:
+            if not self.verilog_file_manager.output_manager.file_manager.file_name:
                 self._generate_output_filename()
 
             self._write_verilog_to_file()
 
             logger.info("Verilog output generated successfully")
         except Exception as e:
-            logger.error(f"Failed to generate output: {e}")
+            logger.error("Failed to generate output: %s", e)
             raise
 
     def _process_generated_verilog(self) -> None:
@@ -172,5 +208,5 @@ class MainOrchestrator(BaseModel):
 
             logger.info("Application workflow completed successfully")
         except Exception as e:
-            logger.error(f"Application workflow failed: {e}")
+            logger.error("Application workflow failed: %s", e)
             raise
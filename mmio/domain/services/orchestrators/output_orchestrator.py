@@ -1,7 +1,7 @@
 from pydantic import BaseModel, Field
 
 from mmio.core.logger import LoggerManager
-from mmio.infrastructure.file_handling.verilog_filemanager import VerilogFileManager
+from mmio.infrastructure.file_handling.verilog_filemanager import VerilogFileManager, verilog_filemanager
 
 logger = LoggerManager.get_logger(__name__)
 
@@ -13,7 +13,7 @@ class OutputOrchestrator(BaseModel):
     - Uses VerilogFileManager to write the code to disk.
     """
 
-    verilog_file_manager: VerilogFileManager = Field(default_factory=VerilogFileManager.get_instance)
+    verilog_file_manager: VerilogFileManager = Field(default_factory=lambda: verilog_filemanager)
 
     def output(self, verilog_code: str) -> None:
         """Write the generated verilog code to a file.
@@ -4,7 +4,7 @@ from typing import Any
 
 import click
 from click import Argument, Command, Group, Option
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field
 
 from mmio.core.logger import LoggerManager
 
@@ -18,15 +18,19 @@ class CLIBase(BaseModel):
     name: str | None = None
     group: Group | Command | None = None
 
-    click_group: Group = Group(name=None)
-    click_command: Command = Command(name=None)
-    click_argument: Argument = Argument(
-        param_decls=["argument_name"],
-        required=False,
+    click_group: Group = Field(default_factory=lambda: Group(name=None))
+    click_command: Command = Field(default_factory=lambda: Command(name=None))
+    click_argument: Argument = Field(
+        default_factory=lambda: Argument(
+            param_decls=["argument_name"],
+            required=False,
+        )
     )
-    click_option: Option = Option(
-        param_decls=["--option_name"],
-        required=False,
+    click_option: Option = Field(
+        default_factory=lambda: Option(
+            param_decls=["--option_name"],
+            required=False,
+        )
     )
 
     def setup_commands(self) -> None:
@@ -78,9 +82,19 @@ class CLICommand(click.Command):
         for param in params:
             self.params.append(param)
 
+    @staticmethod
+    def _short_forms(param: click.Parameter) -> set[str]:
+        """Get the single-letter short forms of an option, without the leading dash."""
+        if not isinstance(param, click.Option):
+            return set()
+        return {opt[1:] for opt in param.opts if len(opt) == 2 and opt.startswith("-")}
+
     def add_parameter(self, param: click.Parameter) -> None:
         """Add a parameter to the command while checking for name conflicts.
 
+        Names and short forms in use are read from ``self.params`` on every call, since
+        callers also append to or replace that list directly.
+
         Args:
             param: The Click parameter to add
 
@@ -88,23 +102,13 @@ class CLICommand(click.Command):
             ValueError: If a parameter with the same name or short form already exists
 
         """
-        existing_names = {p.name for p in self.params}
-        if param.name in existing_names:
+        if param.name in {p.name for p in self.params}:
             raise ValueError(f"Parameter with name '{param.name}' already exists")
 
-        if isinstance(param, click.Option):
-            new_shorts = {opt[1:] for opt in param.opts if len(opt) == 2 and opt.startswith("-")}
-            existing_shorts = {
-                opt[1:]
-                for p in self.params
-                if isinstance(p, click.Option)
-                for opt in p.opts
-                if len(opt) == 2 and opt.startswith("-")
-            }
-
-            conflicts = new_shorts & existing_shorts
-            if conflicts:
-                raise ValueError(f"Short form(s) '-{', -'.join(conflicts)}' already in use by another option")
+        existing_shorts = {short for p in self.params for short in self._short_forms(p)}
+        conflicts = self._short_forms(param) & existing_shorts
+        if conflicts:
+            raise ValueError(f"Short form(s) '-{', -'.join(conflicts)}' already in use by another option")
 
         self.params.append(param)
 
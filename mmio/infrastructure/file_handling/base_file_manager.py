@@ -1,9 +1,10 @@
 """Base file manager with common functionality."""
 
+import os
 from pathlib import Path
 from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
 from mmio.core.logger import LoggerManager
 
@@ -22,19 +23,45 @@ class BaseFileManager(BaseModel):
 
     """
 
-    model_config = ConfigDict(arbitrary_types_allowed=True, validate_assignment=True, extra="forbid")
+    model_config = ConfigDict(arbitrary_types_allowed=True, extra="forbid")
 
     path: Path | None = Field(default=None)
     file_name: str | None = Field(default=None)
 
+    _full_path: tuple[Path, str, Path] | None = PrivateAttr(default=None)
+    _validated_path: Path | None = PrivateAttr(default=None)
+
+    def get_full_path(self) -> Path | None:
+        """Get path joined with file_name, or None if either is unset.
+
+        The joined path is memoized together with the parts it was built from, so it
+        is rebuilt only after path or file_name changes.
+        """
+        path, file_name = self.path, self.file_name
+        if not (path and file_name):
+            return None
+        cached = self._full_path
+        if cached is not None and cached[0] == path and cached[1] == file_name:
+            return cached[2]
+        full_path = path / file_name
+        self._full_path = (path, file_name, full_path)
+        return full_path
+
     def validate_path(self) -> None:
-        """Validate the base path."""
+        """Validate the base path.
+
+        A successfully validated path is remembered, so repeated calls skip the
+        filesystem checks until path changes.
+        """
         if self.path is None:
             raise ValueError("Path is not set")
+        if self.path == self._validated_path:
+            return
         if not self.path.exists():
             self.path.mkdir(parents=True, exist_ok=True)
         if not self.path.is_dir():
             raise ValueError(f"Path is not a directory: {self.path}")
+        self._validated_path = self.path
 
     def validate_file(self, file_path: Path) -> None:
         """Validate a file path."""
@@ -44,14 +71,21 @@ class BaseFileManager(BaseModel):
             raise ValueError(f"Path exists but is not a file: {file_path}")
 
     def list_files(self, pattern: str = "*") -> list[Path]:
-        """List files in the directory with optional pattern matching."""
+        """List files in the directory with optional pattern matching.
+
+        The default "*" pattern is served by a single os.scandir pass instead of glob.
+        """
         self.validate_path()
         if self.path is None:
             return []
         try:
-            files = list(self.path.glob(pattern))
-            logger.info(f"Found {len(files)} files matching pattern '{pattern}' in {self.path}")
+            if pattern == "*":
+                with os.scandir(self.path) as entries:
+                    files = [Path(entry.path) for entry in entries]
+            else:
+                files = list(self.path.glob(pattern))
+            logger.info("Found %d files matching pattern '%s' in %s", len(files), pattern, self.path)
             return files
         except Exception as e:
-            logger.error(f"Error listing files: {e}")
+            logger.error("Error listing files: %s", e)
             return []
@@ -1,7 +1,8 @@
 """Base Input File Manager for reading operations."""
 
+from functools import cache
 from pathlib import Path
-from typing import ClassVar, Optional, Self
+from typing import Self
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -26,33 +27,36 @@ class InputManager(BaseModel):
 
     model_config = BaseFileManager.model_config
 
-    _instance: ClassVar[Optional["InputManager"]] = None
-
     mmio_settings: MMIOSettings = Field(default_factory=MMIOSettings.get_instance)
     file_manager: BaseFileManager = Field(default_factory=BaseFileManager)
 
     @classmethod
+    @cache
     def get_instance(cls) -> "InputManager":
-        """Get the singleton instance of the input manager."""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        """Get the singleton instance of the input manager, built on first use."""
+        return cls()
 
     @model_validator(mode="after")
     def set_default_paths(self) -> Self:
         """Set default paths from settings if not provided."""
-        if self.file_manager.path is None:
-            object.__setattr__(self.file_manager, "path", self.mmio_settings.file_input_path)
-        if self.file_manager.file_name is None:
-            object.__setattr__(self.file_manager, "file_name", self.mmio_settings.file_input_name)
+        file_manager = self.file_manager
+        if file_manager.path is not None and file_manager.file_name is not None:
+            return self
+        if file_manager.path is None:
+            file_manager.path = self.mmio_settings.file_input_path
+        if file_manager.file_name is None:
+            file_manager.file_name = self.mmio_settings.file_input_name
         return self
 
     def get_full_input_path(self) -> Path | None:
         """Get the full input path combining directory and filename."""
-        if self.file_manager.path and self.file_manager.file_name:
-            logger.info(f"Constructing path from: {self.file_manager.path} and {self.file_manager.file_name}")
-            return self.file_manager.path / self.file_manager.file_name
-        logger.error(f"Cannot construct path - path: {self.file_manager.path}, filename: {self.file_manager.file_name}")
+        full_path = self.file_manager.get_full_path()
+        if full_path is not None:
+            logger.info("Constructing path from: %s and %s", self.file_manager.path, self.file_manager.file_name)
+            return full_path
+        logger.error(
+            "Cannot construct path - path: %s, filename: %s", self.file_manager.path, self.file_manager.file_name
+        )
         return None
 
     def read_file(self) -> Path:
@@ -77,9 +81,12 @@ class InputManager(BaseModel):
             raise ValueError("Could not construct input file path")
 
         self.file_manager.validate_file(file_path)
-        logger.info(f"Validated input file: {file_path}")
+        logger.info("Validated input file: %s", file_path)
         return file_path
 
     def list_files(self, pattern: str = "*") -> list[Path]:
         """List files in the directory with optional pattern matching."""
         return self.file_manager.list_files(pattern)
+
+
+input_manager: InputManager = InputManager.get_instance()
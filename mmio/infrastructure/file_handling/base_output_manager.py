@@ -1,7 +1,9 @@
 """Base Output File Manager for writing operations."""
 
+import os
+from functools import cache
 from pathlib import Path
-from typing import ClassVar, Optional, Self
+from typing import Self
 
 from pydantic import BaseModel, Field, model_validator
 
@@ -27,34 +29,33 @@ class OutputManager(BaseModel):
 
     model_config = BaseFileManager.model_config
 
-    _instance: ClassVar[Optional["OutputManager"]] = None
-
     settings: VerilogSettings = Field(default_factory=VerilogSettings.get_instance)
     file_manager: BaseFileManager = Field(default_factory=BaseFileManager)
     folder_name: str | None = Field(default=None)
 
     @classmethod
+    @cache
     def get_instance(cls) -> "OutputManager":
-        """Get the singleton instance of the output manager."""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        """Get the singleton instance of the output manager, built on first use."""
+        return cls()
 
     @model_validator(mode="after")
     def set_default_paths(self) -> Self:
         """Set default paths from settings if not provided."""
         if self.file_manager.path is None:
-            object.__setattr__(self.file_manager, "path", self.settings.file_output_path)
+            self.file_manager.path = self.settings.file_output_path
         return self
 
     def get_full_output_path(self) -> Path | None:
         """Get the full output path combining directory and filename."""
-        if self.file_manager.path and self.file_manager.file_name:
-            return self.file_manager.path / self.file_manager.file_name
-        return None
+        return self.file_manager.get_full_path()
 
     def write_file(self, content: str) -> None:
-        """Write content to output file."""
+        """Write content to output file.
+
+        The content goes to a sibling temporary file that is then renamed over the
+        target, so an interrupted write never leaves a truncated output file.
+        """
         self.file_manager.validate_path()
         if self.file_manager.path is None:
             raise ValueError("Output path is not set")
@@ -65,5 +66,15 @@ class OutputManager(BaseModel):
         if file_path is None:
             raise ValueError("Could not construct output file path")
 
-        logger.info(f"Writing file: {file_path}")
-        file_path.write_text(content)
+        logger.info("Writing file: %s", file_path)
+        temp_path = file_path.with_name(f"{file_path.name}.tmp")
+        try:
+            with temp_path.open("w", encoding="utf-8", buffering=1 << 20) as handle:
+                handle.write(content)
+            os.replace(temp_path, file_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+
+output_manager: OutputManager = OutputManager.get_instance()
@@ -1,12 +1,12 @@
 """MMIO File Manager for handling MMIO log files."""
 
+from functools import cache
 from pathlib import Path
-from typing import ClassVar, Optional
 
 from pydantic import BaseModel, Field
 
 from mmio.core.logger import LoggerManager
-from mmio.infrastructure.file_handling.base_input_manager import InputManager
+from mmio.infrastructure.file_handling.base_input_manager import InputManager, input_manager
 
 logger = LoggerManager.get_logger(__name__)
 
@@ -22,15 +22,13 @@ class MMIOFileManager(BaseModel):
 
     """
 
-    _instance: ClassVar[Optional["MMIOFileManager"]] = None
-    input_manager: InputManager = Field(default_factory=InputManager.get_instance)
+    input_manager: InputManager = Field(default_factory=lambda: input_manager)
 
     @classmethod
+    @cache
     def get_instance(cls) -> "MMIOFileManager":
-        """Get the singleton instance of MMIOFileManager."""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        """Get the singleton instance of MMIOFileManager, built on first use."""
+        return cls()
 
     def read_file(self) -> Path:
         """Validate and return the path to the specified MMIO log file."""
@@ -39,3 +37,6 @@ class MMIOFileManager(BaseModel):
     def list_files(self) -> list[Path]:
         """List all files in the input directory."""
         return self.input_manager.list_files()
+
+
+mmio_filemanager: MMIOFileManager = MMIOFileManager.get_instance()
@@ -1,13 +1,13 @@
 """Verilog File Manager for handling Verilog file generation."""
 
 from datetime import datetime
+from functools import cache
 from pathlib import Path
-from typing import ClassVar, Optional
 
 from pydantic import BaseModel, Field
 
 from mmio.core.logger import LoggerManager
-from mmio.infrastructure.file_handling.base_output_manager import OutputManager
+from mmio.infrastructure.file_handling.base_output_manager import OutputManager, output_manager
 
 logger = LoggerManager.get_logger(__name__)
 
@@ -23,15 +23,13 @@ class VerilogFileManager(BaseModel):
 
     """
 
-    _instance: ClassVar[Optional["VerilogFileManager"]] = None
-    output_manager: OutputManager = Field(default_factory=OutputManager.get_instance)
+    output_manager: OutputManager = Field(default_factory=lambda: output_manager)
 
     @classmethod
+    @cache
     def get_instance(cls) -> "VerilogFileManager":
-        """Get the singleton instance of VerilogFileManager."""
-        if cls._instance is None:
-            cls._instance = cls()
-        return cls._instance
+        """Get the singleton instance of VerilogFileManager, built on first use."""
+        return cls()
 
     def write_file(self, content: str) -> None:
         """Write generated Verilog content to an output file."""
@@ -40,11 +38,19 @@ class VerilogFileManager(BaseModel):
         self.output_manager.write_file(content)
 
     def generate_output_filename(self) -> str:
-        """Generate output filename with timestamp."""
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        """Generate output filename with timestamp.
+
+        An output filename that is already set is kept, so repeated calls in one run
+        agree on a single file.
+        """
+        existing = self.output_manager.file_manager.file_name
+        if existing:
+            return existing
+        now = datetime.now()
+        timestamp = f"{now.year:04d}{now.month:02d}{now.day:02d}{now.hour:02d}{now.minute:02d}{now.second:02d}"
         filename = f"generated_verilog_{timestamp}.v"
         self.output_manager.file_manager.file_name = filename
-        logger.info(f"Generated output filename: {filename}")
+        logger.info("Generated output filename: %s", filename)
         return filename
 
 
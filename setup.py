@@ -13,6 +13,9 @@ setup(
         "rich>=13.9.4",
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.9.0",
+        ],
         "dev": [
             "mypy>=1.14.1",
             "pyright>=1.1.392.post0",
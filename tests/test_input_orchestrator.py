@@ -0,0 +1,33 @@
+"""Tests for InputOrchestrator."""
+
+from pathlib import Path
+
+from mmio.domain.models.verilog_data import VerilogData
+from mmio.domain.services.orchestrators.input_orchestrator import InputOrchestrator
+from mmio.infrastructure.file_handling.base_file_manager import BaseFileManager
+from mmio.infrastructure.file_handling.base_input_manager import InputManager
+from mmio.infrastructure.file_handling.mmio_filemanager import MMIOFileManager
+
+TRACE = (
+    "W 1 298.823649 1 0xf70003fc 0x7a 0x0 0\n"
+    "R 2 inf 1 0xf7000400 0x1 0x0 0\n"
+    "R 3 1e400 1 0xf7000404 0x2 0x0 0\n"
+    "R 4 298.823700 1 0xf7000408 0x3 0x0 0\n"
+)
+
+
+def _orchestrator(directory: Path, file_name: str) -> InputOrchestrator:
+    file_manager = BaseFileManager(path=directory, file_name=file_name)
+    return InputOrchestrator(mmio_file_manager=MMIOFileManager(input_manager=InputManager(file_manager=file_manager)))
+
+
+def test_execute_skips_non_finite_timestamps(tmp_path: Path) -> None:
+    """Lines with an infinite timestamp are dropped instead of aborting the input step."""
+    (tmp_path / "inf.trace").write_text(TRACE)
+    VerilogData.reset_tracking()
+
+    orchestrator = _orchestrator(tmp_path, "inf.trace")
+    processed = orchestrator.execute()
+
+    assert {bar: len(entries) for bar, entries in processed.items()} == {1: 2}
+    assert [row.counter for row in orchestrator.parser.collect_invalid_rows()] == [2, 3]